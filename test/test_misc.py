@@ -13,6 +13,8 @@ not, see <http://www.gnu.org/licenses/>.
 
 import unittest
 import os
+import sys
+import gzip
 import unicycler.misc
 
 
@@ -182,6 +184,59 @@ class TestMiscFunctions(unittest.TestCase):
         self.assertTrue(fasta[2][1].endswith('AGTTGATTTAAATCGCTACACCATTATGATTCATGTAGCGATTTAAATTACT'
                                              'ACATAATGGTGATTAGC'))
 
+    def test_load_fasta_gzipped(self):
+        sample_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'sample_data')
+        ref = os.path.join(sample_dir, 'reference.fasta')
+        gzipped_ref = os.path.join(os.path.dirname(__file__), 'temp_test.fasta.gz')
+        with open(ref, 'rb') as plain_file, gzip.open(gzipped_ref, 'wb') as gzipped_file:
+            gzipped_file.write(plain_file.read())
+        self.assertEqual(unicycler.misc.load_fasta(gzipped_ref), unicycler.misc.load_fasta(ref))
+        os.remove(gzipped_ref)
+
+    def test_load_fasta_line_endings(self):
+        test_fasta = os.path.join(os.path.dirname(__file__), 'temp_test.fasta')
+        with open(test_fasta, 'wb') as fasta:
+            fasta.write(b'\r\n>seq_1 description\r\nACGT\r\n\r\nTTGA\r\n>seq_2\nGG\n\nCC')
+        fasta = unicycler.misc.load_fasta_with_full_header(test_fasta)
+        self.assertEqual(fasta, [('seq_1', 'seq_1 description', 'ACGTTTGA'),
+                                 ('seq_2', 'seq_2', 'GGCC')])
+        os.remove(test_fasta)
+
+    def test_load_fasta_indented_header(self):
+        test_fasta = os.path.join(os.path.dirname(__file__), 'temp_test.fasta')
+        with open(test_fasta, 'wb') as fasta:
+            fasta.write(b'>seq_1\nACGT\n >seq_2\nTT\n\t> seq_3 a>b\nGG>C\n')
+        fasta = unicycler.misc.load_fasta_with_full_header(test_fasta)
+        self.assertEqual(fasta, [('seq_1', 'seq_1', 'ACGT'),
+                                 ('seq_2', 'seq_2', 'TT'),
+                                 ('seq_3', ' seq_3 a>b', 'GG>C')])
+        os.remove(test_fasta)
+
+    def test_run_command_discarding_stdout(self):
+        unicycler.misc.run_command_discarding_stdout([sys.executable, '-c', 'print("x" * 100000)'],
+                                                     ValueError)
+        with self.assertRaises(ValueError) as context:
+            unicycler.misc.run_command_discarding_stdout(
+                [sys.executable, '-c', 'import sys; print("out"); sys.exit("err")'],
+                ValueError, 'failed:\n')
+        self.assertEqual(str(context.exception), 'failed:\nerr\n')
+
+    def test_is_file_up_to_date(self):
+        test_dir = os.path.dirname(__file__)
+        input_file = os.path.join(test_dir, 'temp_test_input.txt')
+        output_file = os.path.join(test_dir, 'temp_test_output.txt')
+        for f in [input_file, output_file]:
+            open(f, 'wt').close()
+        self.assertFalse(unicycler.misc.is_file_up_to_date(output_file + '_missing', [input_file]))
+        os.utime(input_file, (1000, 1000))
+        os.utime(output_file, (2000, 2000))
+        self.assertTrue(unicycler.misc.is_file_up_to_date(output_file, [input_file, None]))
+        os.utime(input_file, (3000, 3000))
+        self.assertFalse(unicycler.misc.is_file_up_to_date(output_file, [input_file, None]))
+        self.assertTrue(unicycler.misc.is_file_up_to_date(output_file, [None]))
+        os.remove(input_file)
+        os.remove(output_file)
+
     def test_load_fasta_with_full_header(self):
         sample_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'sample_data')
         ref = os.path.join(sample_dir, 'reference.fasta')
@@ -21,7 +21,7 @@ import sys
 import itertools
 import collections
 from .misc import green, red, line_iterator, print_table, int_to_str, float_to_str, \
-    reverse_complement, gfa_path
+    reverse_complement, gfa_path, is_file_up_to_date
 from .minimap_alignment import align_long_reads_to_assembly_graph, range_overlap_size, \
     load_minimap_alignments
 from .string_graph import StringGraph, StringGraphSegment, \
@@ -87,8 +87,11 @@ def make_miniasm_string_graph(graph, read_dict, long_read_filename, scoring_sche
     contigs_placed_filename = os.path.join(miniasm_dir, '15_contigs_placed.gfa')
     miniasm_read_list = os.path.join(miniasm_dir, 'all_reads.txt')
 
-    # If the long read assembly already exists, then we can skip ahead quite a lot.
-    if os.path.isfile(pilon_polished_filename) and os.path.isfile(miniasm_read_list):
+    # If the long read assembly already exists (and was made from the current inputs), then we can
+    # skip ahead quite a lot.
+    inputs = [args.long, args.short1, args.short2, args.unpaired, existing_long_read_assembly]
+    if is_file_up_to_date(pilon_polished_filename, inputs) and \
+            is_file_up_to_date(miniasm_read_list, inputs):
         log.log('Long read assembly already exists: ' + pilon_polished_filename)
         log.log('')
         unitig_graph = StringGraph(pilon_polished_filename)
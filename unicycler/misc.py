@@ -25,6 +25,7 @@ import re
 import textwrap
 import datetime
 import multiprocessing
+import mmap
 from . import settings
 from . import log
 
@@ -343,6 +344,30 @@ def get_sequence_file_type(filename):
         raise ValueError('File is neither FASTA or FASTQ')
 
 
+def run_command_discarding_stdout(command, error_type, error_message=''):
+    """
+    Runs a command whose stdout isn't wanted (e.g. bowtie2-build, which is very verbose). Stdout
+    goes to /dev/null instead of being buffered in memory and only stderr is captured. If the
+    command fails, error_type is raised with error_message followed by the stderr.
+    """
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    _, stderr = process.communicate()
+    if process.returncode != 0:
+        raise error_type(error_message + stderr.decode())
+
+
+def is_file_up_to_date(filename, input_filenames):
+    """
+    Returns whether the file exists and is at least as new as all of the given input files (inputs
+    which are None or missing are ignored). This is used to decide whether an intermediate file left
+    by a previous run can be reused, so a file made from older versions of the inputs isn't.
+    """
+    if not os.path.isfile(filename):
+        return False
+    input_times = [os.path.getmtime(f) for f in input_filenames if f and os.path.isfile(f)]
+    return not input_times or os.path.getmtime(filename) >= max(input_times)
+
+
 def get_num_agreement(num_1, num_2):
     """
     Returns a value between 0.0 and 1.0 describing how well the numbers agree.
@@ -383,52 +408,80 @@ def load_fasta(filename):
     """
     Returns a list of tuples (name, seq) for each record in the fasta file.
     """
-    fasta_seqs = []
-    open_func = get_open_function(filename)
-    with open_func(filename, 'rt') as fasta_file:
-        name = ''
-        sequence = ''
-        for line in fasta_file:
-            line = line.strip()
-            if not line:
-                continue
-            if line[0] == '>':  # Header line = start of new contig
-                if name:
-                    fasta_seqs.append((name.split()[0], sequence))
-                    sequence = ''
-                name = line[1:]
-            else:
-                sequence += line
-        if name:
-            fasta_seqs.append((name.split()[0], sequence))
-    return fasta_seqs
+    return [(header.split()[0], seq) for header, seq in load_fasta_records(filename)]
 
 
 def load_fasta_with_full_header(filename):
     """
     Returns a list of tuples (name, header, seq) for each record in the fasta file.
     """
+    return [(header.split()[0], header, seq) for header, seq in load_fasta_records(filename)]
+
+
+def load_fasta_records(filename):
+    """
+    Returns a list of tuples (header, seq) for each record in the fasta file. Uncompressed files
+    are memory-mapped and gzipped files are decompressed in one read, then both are split into
+    records using bytes.find, so there is no per-line Python work. For the common case of a
+    single-record reference, this means the whole sequence is built with one slice.
+    """
+    if get_compression_type(filename) == 'gz':
+        with gzip.open(filename, 'rb') as fasta_file:
+            return split_fasta_records(fasta_file.read())
+    if os.path.getsize(filename) == 0:  # mmap can't map an empty file
+        return []
+    with open(filename, 'rb') as fasta_file:
+        with mmap.mmap(fasta_file.fileno(), 0, access=mmap.ACCESS_READ) as fasta_data:
+            return split_fasta_records(fasta_data)
+
+
+def split_fasta_records(fasta_data):
+    """
+    Takes the contents of a fasta file as a bytes-like object (e.g. bytes or mmap) and returns a
+    list of tuples (header, seq). Each record is sliced out whole and all of its whitespace is
+    removed in a single pass, so sequences are built without splitting them into lines. Otherwise
+    this gives the same records as reading the file line by line: sequence before the first header
+    or under an empty header is joined onto the next named record.
+    """
     fasta_seqs = []
-    open_func = get_open_function(filename)
-    with open_func(filename, 'rt') as fasta_file:
-        name = ''
-        sequence = ''
-        for line in fasta_file:
-            line = line.strip()
-            if not line:
-                continue
-            if line[0] == '>':  # Header line = start of new contig
-                if name:
-                    fasta_seqs.append((name.split()[0], name, sequence))
-                    sequence = ''
-                name = line[1:]
-            else:
-                sequence += line
-        if name:
-            fasta_seqs.append((name.split()[0], name, sequence))
+    data_len = len(fasta_data)
+    header_start = find_fasta_header(fasta_data, 0)
+    carried_seq = [fasta_data[:header_start]] if header_start > 0 else []
+    while header_start != -1:
+        header_end = fasta_data.find(b'\n', header_start)
+        if header_end == -1:
+            header_end = data_len
+        next_header_start = find_fasta_header(fasta_data, header_end)
+        seq_end = data_len if next_header_start == -1 else next_header_start
+        carried_seq.append(fasta_data[header_end:seq_end])
+        header = fasta_data[header_start + 1:header_end].decode().rstrip()
+        if header:
+            sequence = b''.join(carried_seq).translate(None, b' \t\n\r\x0b\x0c').decode()
+            fasta_seqs.append((header, sequence))
+            carried_seq = []
+        header_start = next_header_start
     return fasta_seqs
 
 
+def find_fasta_header(fasta_data, start):
+    """
+    Returns the position of the '>' which begins the next header line at or after start (which must
+    be the start of a line or the line break before it), or -1 if there isn't one. A '>' only
+    counts if it is the first non-whitespace character on its line.
+    """
+    gt_pos = fasta_data.find(b'>', start)
+    while gt_pos != -1:
+        line_start = fasta_data.rfind(b'\n', start, gt_pos)
+        line_start = start if line_start == -1 else line_start + 1
+        if not fasta_data[line_start:gt_pos].strip():
+            return gt_pos
+        start = fasta_data.find(b'\n', gt_pos)  # not a header, so skip the rest of this line
+        if start == -1:
+            return -1
+        gt_pos = fasta_data.find(b'>', start)
+    return -1
+
+
 def score_function(val, half_score_val):
     """
     For inputs of 0.0 and greater, this function returns a value between 0.0 and 1.0, approaching
@@ -17,7 +17,8 @@ import os
 import subprocess
 import shutil
 from collections import defaultdict
-from .misc import load_fasta, reverse_complement, int_to_str, underline, get_percentile_sorted, dim
+from .misc import load_fasta, reverse_complement, int_to_str, underline, get_percentile_sorted, \
+    dim, run_command_discarding_stdout
 from .assembly_graph import AssemblyGraph
 from .assembly_graph_segment import Segment
 from .string_graph import StringGraph, StringGraphSegment
@@ -103,10 +104,8 @@ def get_insert_size_range(graph, args, polish_dir):
     # Prepare the FASTA for Bowtie2 alignment.
     bowtie2_build_command = [args.bowtie2_build_path, fasta_filename, fasta_filename]
     log.log(dim('  ' + ' '.join(bowtie2_build_command)), 2)
-    try:
-        subprocess.check_output(bowtie2_build_command, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
-        raise CannotPolish('bowtie2-build encountered an error:\n' + e.output.decode())
+    run_command_discarding_stdout(bowtie2_build_command, CannotPolish,
+                                  'bowtie2-build encountered an error:\n')
     if not any(x.endswith('.bt2') for x in os.listdir(polish_dir)):
         raise CannotPolish('bowtie2-build failed to build an index')
 
@@ -218,10 +217,8 @@ def polish_with_pilon(graph, args, polish_dir, insert_size_1st, insert_size_99th
     # Prepare the FASTA for Bowtie2 alignment.
     bowtie2_build_command = [args.bowtie2_build_path, input_filename, input_filename]
     log.log(dim('  ' + ' '.join(bowtie2_build_command)), 2)
-    try:
-        subprocess.check_output(bowtie2_build_command, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
-        raise CannotPolish('bowtie2-build encountered an error:\n' + e.output.decode())
+    run_command_discarding_stdout(bowtie2_build_command, CannotPolish,
+                                  'bowtie2-build encountered an error:\n')
     if not any(x.endswith('.bt2') for x in os.listdir(polish_dir)):
         raise CannotPolish('bowtie2-build failed to build an index')
 
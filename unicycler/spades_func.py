@@ -19,7 +19,8 @@ import gzip
 import shutil
 import statistics
 from .misc import round_to_nearest_odd, get_compression_type, int_to_str, quit_with_error,\
-    strip_read_extensions, bold, dim, print_table, get_left_arrow, float_to_str
+    strip_read_extensions, bold, dim, print_table, get_left_arrow, float_to_str, \
+    is_file_up_to_date
 from .assembly_graph import AssemblyGraph
 from . import log
 
@@ -216,9 +217,10 @@ def spades_read_correction(short1, short2, unpaired, spades_dir, threads, spades
     corrected_1 = os.path.join(spades_dir, 'corrected_1.fastq.gz')
     corrected_2 = os.path.join(spades_dir, 'corrected_2.fastq.gz')
     corrected_u = os.path.join(spades_dir, 'corrected_u.fastq.gz')
-    corrected_1_exists = os.path.isfile(corrected_1)
-    corrected_2_exists = os.path.isfile(corrected_2)
-    corrected_u_exists = os.path.isfile(corrected_u)
+    input_reads = [short1, short2, unpaired]
+    corrected_1_exists = is_file_up_to_date(corrected_1, input_reads)
+    corrected_2_exists = is_file_up_to_date(corrected_2, input_reads)
+    corrected_u_exists = is_file_up_to_date(corrected_u, input_reads)
 
     reads_already_exist = True
     if using_paired_reads and (not corrected_1_exists or not corrected_2_exists):
@@ -425,7 +427,8 @@ def get_kmer_range(reads_1_filename, reads_2_filename, unpaired_reads_filename,
 
     # If the k-mer range file already exists, we use its values and proceed.
     kmer_range_filename = os.path.join(spades_dir, 'kmer_range')
-    if os.path.isfile(kmer_range_filename):
+    if is_file_up_to_date(kmer_range_filename,
+                          [reads_1_filename, reads_2_filename, unpaired_reads_filename]):
         with open(kmer_range_filename, 'rt') as kmer_range_file:
             kmer_range = kmer_range_file.readline().strip().split(', ')
         if kmer_range:
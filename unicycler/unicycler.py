@@ -35,7 +35,7 @@ from .misc import int_to_str, float_to_str, quit_with_error, get_percentile, bol
     get_default_thread_count, spades_path_and_version, makeblastdb_path_and_version, \
     tblastn_path_and_version, bowtie2_build_path_and_version, bowtie2_path_and_version, \
     samtools_path_and_version, java_path_and_version, pilon_path_and_version, \
-    racon_path_and_version, bcftools_path_and_version, gfa_path, red
+    racon_path_and_version, bcftools_path_and_version, gfa_path, red, is_file_up_to_date
 from .spades_func import get_best_spades_graph
 from .blast_func import find_start_gene, CannotFindStart
 from .unicycler_align import add_aligning_arguments, fix_up_arguments, AlignmentScoringScheme, \
@@ -75,7 +75,9 @@ def main():
 
         # Produce a SPAdes assembly graph with a k-mer that balances contig length and connectivity.
         best_spades_graph = gfa_path(args.out, next(counter), 'best_spades_graph')
-        if os.path.isfile(best_spades_graph):
+        spades_graph_exists = is_file_up_to_date(best_spades_graph,
+                                                 [args.short1, args.short2, args.unpaired])
+        if spades_graph_exists:
             log.log('\nSPAdes graph already exists. Will use this graph instead of running '
                     'SPAdes:\n  ' + best_spades_graph)
             graph = AssemblyGraph(best_spades_graph, None)
@@ -86,7 +88,7 @@ def main():
                                           args.kmer_count, args.min_kmer_frac, args.max_kmer_frac,
                                           args.no_correct, args.linear_seqs)
         determine_copy_depth(graph)
-        if args.keep > 0 and not os.path.isfile(best_spades_graph):
+        if args.keep > 0 and not spades_graph_exists:
             graph.save_to_gfa(best_spades_graph, save_copy_depth_info=True, newline=True,
                               include_insert_size=True)
 
@@ -958,8 +960,10 @@ def align_long_reads_to_assembly_graph(graph, anchor_segments, args, full_comman
     references = load_references(graph_fasta, section_header=None, show_progress=False)
     reference_dict = {x.name: x for x in references}
 
-    # Load existing alignments if available.
-    if os.path.isfile(alignments_sam) and sam_references_match(alignments_sam, graph):
+    # Load existing alignments if available. The SAM is checked against the original long read
+    # file, not long_read_filename, which may be a deduplicated copy rewritten on every run.
+    if is_file_up_to_date(alignments_sam, [args.long]) and \
+            sam_references_match(alignments_sam, graph):
         log.log('\nSAM file already exists. Will use these alignments instead of conducting '
                 'a new alignment:')
         log.log('  ' + alignments_sam)
@@ -33,7 +33,7 @@ from .misc import add_line_breaks_to_sequence, load_fasta, MyHelpFormatter, prin
     get_percentile_sorted, get_pilon_jar_path, colour, bold, bold_green, bold_yellow_underline, \
     dim, get_all_files_in_current_dir, check_file_exists, remove_formatting, \
     get_sequence_file_type, convert_fastq_to_fasta, load_fasta_with_full_header, get_timestamp, \
-    get_left_arrow, get_right_arrow, get_default_thread_count
+    get_left_arrow, get_right_arrow, get_default_thread_count, run_command_discarding_stdout
 
 
 def main():
@@ -617,7 +617,6 @@ def long_read_polish_small_changes_racon(fasta, round_num, args, all_ale_scores,
         raw_variants.write(show_snps_out)
 
     variants = load_variants_from_show_snps(raw_variants_file, fasta, args)
-    variants = merge_variants(variants, fasta, args)
 
     align_illumina_reads(fasta, args, local=False)
     p = multiprocessing.Pool(args.threads)
@@ -635,9 +634,8 @@ def long_read_polish_small_changes_racon(fasta, round_num, args, all_ale_scores,
     return current, round_num, filtered_variants
 
 
-def merge_variants(variants, fasta, args):
+def merge_variants(variants, reference, args):
     merged_variants = []
-    reference = dict(load_fasta(fasta, ))
     variants_to_merge = []
     for v in variants:
         if not variants_to_merge:
@@ -1237,6 +1235,12 @@ def finish(current, all_ale_scores, round_num, args, short):
 
 def run_command(command, args, nice=False):
     print_command(command, args.verbosity)
+
+    # bowtie2-build outputs too much, even for verbose mode, so its stdout isn't kept at all.
+    if 'bowtie2-build' in command[0] and not nice:
+        run_command_discarding_stdout(command, SystemExit)
+        return
+
     try:
         if nice:
             out = subprocess.check_output(command, stderr=subprocess.STDOUT, shell=False,
@@ -1244,8 +1248,7 @@ def run_command(command, args, nice=False):
         else:
             out = subprocess.check_output(command, stderr=subprocess.STDOUT, shell=False)
 
-        # bowtie2-build outputs too much, even for verbose mode.
-        if args.verbosity > 2 and 'bowtie2-build' not in command[0]:
+        if args.verbosity > 2:
             print(dim(remove_formatting(out.decode())))
     except subprocess.CalledProcessError as e:
         sys.exit(e.output.decode())
@@ -1263,6 +1266,10 @@ def load_variants_from_arrow(gff_file, fasta, args):
 
 
 def load_variants_from_show_snps(raw_variants_file, fasta, args):
+    """
+    show-snps reports indels one base at a time, so adjacent variants are merged here while the
+    parsed reference is still in hand.
+    """
     reference = dict(load_fasta(fasta))
     variants = []
     with open(raw_variants_file, 'rt') as snps:
@@ -1270,7 +1277,7 @@ def load_variants_from_show_snps(raw_variants_file, fasta, args):
             line = line.strip()
             if line:
                 variants.append(Variant(reference, args.large, show_snps_line=line))
-    return variants
+    return merge_variants(variants, reference, args)
 
 
 def load_variants_from_pilon_changes(pilon_changes_file, fasta, large_var_size):
@@ -16,7 +16,7 @@ not, see <http://www.gnu.org/licenses/>.
 import os
 import subprocess
 import shutil
-from .misc import dim
+from .misc import dim, run_command_discarding_stdout
 from . import log
 
 
@@ -54,10 +54,8 @@ def make_vcf(vcf_filename, args, assembly_file, insert_size_1st, insert_size_99t
     # Prepare the FASTA for Bowtie2 alignment.
     bowtie2_build_command = [args.bowtie2_build_path, input_fasta, input_fasta]
     log.log(dim('  ' + ' '.join(bowtie2_build_command)), 2)
-    try:
-        subprocess.check_output(bowtie2_build_command, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
-        raise CannotMakeVcf('bowtie2-build encountered an error:\n' + e.output.decode())
+    run_command_discarding_stdout(bowtie2_build_command, CannotMakeVcf,
+                                  'bowtie2-build encountered an error:\n')
     if not any(x.endswith('.bt2') for x in os.listdir(vcf_dir)):
         raise CannotMakeVcf('bowtie2-build failed to build an index')
 